@@ -8,7 +8,6 @@ visualization capabilities using MiniLibX.
 
 import os
 import sys
-import re
 from typing import Callable, Dict, Any, List, Optional, Tuple, cast
 from collections import deque
 
@@ -20,11 +19,28 @@ except ImportError:
     print("Advertencia: No se pudo importar mlx. \
         La visualización no estará disponible.")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("Advertencia: No se pudo importar numpy. \
+        Se usará el dibujado píxel a píxel.")
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 try:
     from src.MazeGenerator import MazeGenerator
 except ImportError:
     print("Advertencia: mazegen no instalado. Usando versión embebida.")
 
+_HEX_CHARS = frozenset('0123456789ABCDEFabcdef')
+_PATH_CHARS = frozenset('NSEWnsew')
+
 CELL_SIZE = 20
 MIN_CELL_SIZE = 5
 MAX_CELL_SIZE = 50
@@ -55,6 +71,20 @@ ALT_LOGO_COLORS = [
     0xAAFF00FF,
 ]
 
+if NUMPY_AVAILABLE:
+    HEX_LUT = np.full(256, 255, np.uint8)
+    HEX_LUT[ord('0'):ord('9') + 1] = np.arange(10, dtype=np.uint8)
+    HEX_LUT[ord('A'):ord('F') + 1] = np.arange(10, 16, dtype=np.uint8)
+    HEX_LUT[ord('a'):ord('f') + 1] = np.arange(10, 16, dtype=np.uint8)
+
+# Direction deltas indexed by ord(c) for 'N', 'S', 'E', 'W'.
+DX = [0] * 128
+DY = [0] * 128
+DX[ord('E')] = 1
+DX[ord('W')] = -1
+DY[ord('N')] = -1
+DY[ord('S')] = 1
+
 KEY_ESC = 65307
 KEY_ENTER = 65293
 KEY_1 = 49
@@ -72,6 +102,10 @@ ON_DESTROY = 33
 
 show_path_state = False
 maze_state: Optional[Dict[str, Any]] = None
+_config_cache: Optional[Dict[str, Any]] = None
+_parse_cache: Dict[Tuple[str, float], Tuple[List[str], int, int,
+                                            Tuple[int, int],
+                                            Tuple[int, int], str]] = {}
 mlx_instance: Optional[Any] = None
 current_wall_color_index = 0
 current_logo_color_index = 0
@@ -101,7 +135,9 @@ def read_file_lines(filepath: str) -> List[str]:
     """
     try:
         with open(filepath, 'r', encoding='utf-8') as file:
-            return [line.strip() for line in file.readlines() if line.strip()]
+            text = file.read()
+        return [stripped for line in text.splitlines()
+                if (stripped := line.strip())]
     except FileNotFoundError:
         raise FileNotFoundError(f"Archivo no encontrado: {filepath}")
     except IOError as e:
@@ -251,6 +287,27 @@ def parse_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
+def get_config() -> Dict[str, Any]:
+    """
+    Parses the configuration file once and memoizes the result.
+
+    Regenerating or reloading the maze from a keypress would otherwise
+    re-read and re-validate the configuration file every time.
+
+    Returns:
+        Dictionary with the parsed configuration.
+
+    Raises:
+        ConfigError: If the configuration is invalid.
+        FileNotFoundError: If the file does not exist.
+    """
+    global _config_cache
+
+    if _config_cache is None:
+        _config_cache = parse_config(sys.argv[1])
+    return _config_cache
+
+
 def write_output_file(filename: str, maze: MazeGenerator,
                       entry: Tuple[int, int], exit_: Tuple[int, int],
                       path: str) -> None:
@@ -266,16 +323,15 @@ def write_output_file(filename: str, maze: MazeGenerator,
     """
     hex_matrix = maze.to_hex_matrix()
 
-    content_parts = [
-        "\n".join(hex_matrix),
-        "",
-        f"{entry[0]},{entry[1]}",
-        f"{exit_[0]},{exit_[1]}",
-        path,
-        ""
-    ]
+    try:
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.writelines(line + "\n" for line in hex_matrix)
+            file.write(f"\n{entry[0]},{entry[1]}\n"
+                       f"{exit_[0]},{exit_[1]}\n"
+                       f"{path}\n")
+    except IOError as e:
+        raise IOError(f"Error al escribir el archivo: {e}")
 
-    write_file(filename, "\n".join(content_parts))
     print(f"Laberinto guardado en: {filename}")
 
 
@@ -343,13 +399,14 @@ def parse_maze_file(file_path: str) -> Tuple[List[str], int, int,
     path_line = None
 
     for line in lines:
-        if re.fullmatch(r'[0-9A-Fa-f]+', line):
+        if ',' in line:
+            if entry_line is None:
+                entry_line = line
+            elif exit_line is None:
+                exit_line = line
+        elif not (set(line) - _HEX_CHARS):
             hex_lines.append(line)
-        elif ',' in line and entry_line is None:
-            entry_line = line
-        elif ',' in line and exit_line is None:
-            exit_line = line
-        elif any(c in line.upper() for c in 'NSEW'):
+        elif line[0] in _PATH_CHARS:
             path_line = line
 
     if not hex_lines:
@@ -372,6 +429,63 @@ def parse_maze_file(file_path: str) -> Tuple[List[str], int, int,
     return hex_lines, width, height, entry, exit_coords, path
 
 
+def parse_maze_file_cached(file_path: str) -> Tuple[List[str], int, int,
+                                                    Tuple[int, int],
+                                                    Tuple[int, int], str]:
+    """
+    Parses a maze file, reusing the result while the file is unchanged.
+
+    The cache is keyed by (path, mtime), so rewriting the output file
+    (e.g. regenerating with key 1) invalidates it automatically and a
+    path/color toggle does not re-read or re-parse anything.
+
+    Args:
+        file_path: Path to the maze file.
+
+    Returns:
+        Same tuple as parse_maze_file.
+    """
+    try:
+        cache_key = (file_path, os.path.getmtime(file_path))
+    except OSError:
+        return parse_maze_file(file_path)
+
+    parsed = _parse_cache.get(cache_key)
+    if parsed is None:
+        parsed = parse_maze_file(file_path)
+        _parse_cache.clear()
+        _parse_cache[cache_key] = parsed
+    return parsed
+
+
+def decode_hex_grid(hex_lines: List[str], width: int,
+                    height: int) -> Optional[Any]:
+    """
+    Decodes the hexadecimal grid into an array of wall nibbles.
+
+    A 256-entry lookup table indexed by byte value converts the whole
+    grid in one vectorized step instead of one int(c, 16) per cell.
+    Invalid characters decode to the sentinel value 255.
+
+    Args:
+        hex_lines: Normalized hexadecimal lines of the maze.
+        width: Width of the maze.
+        height: Height of the maze.
+
+    Returns:
+        uint8 array of shape (height, width) with the cell nibbles,
+        or None if numpy is not available or the lines are not ASCII.
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+
+    try:
+        raw = np.frombuffer(''.join(hex_lines).encode('ascii'), np.uint8)
+        return HEX_LUT[raw].reshape(height, width)
+    except (UnicodeEncodeError, ValueError):
+        return None
+
+
 def get_current_wall_color() -> int:
     """
     Gets the current wall color.
@@ -379,7 +493,7 @@ def get_current_wall_color() -> int:
     Returns:
         Hexadecimal wall color.
     """
-    return ALT_WALL_COLORS[current_wall_color_index % len(ALT_WALL_COLORS)]
+    return ALT_WALL_COLORS[current_wall_color_index]
 
 
 def get_current_logo_color() -> int:
@@ -389,7 +503,7 @@ def get_current_logo_color() -> int:
     Returns:
         Hexadecimal color for closed cell fill.
     """
-    return ALT_LOGO_COLORS[current_logo_color_index % len(ALT_LOGO_COLORS)]
+    return ALT_LOGO_COLORS[current_logo_color_index]
 
 
 def cycle_wall_color() -> None:
@@ -414,6 +528,99 @@ def cycle_logo_color() -> None:
     print(f"Color del logo cambiado (#{color_num}/{total_colors})")
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _render_maze(nibbles: Any, path_bitmap: Any, entry_x: int,
+                     entry_y: int, exit_x: int, exit_y: int, buf: Any,
+                     cs: int, colors: Any) -> None:
+        """Compiled render of the whole cell grid into the image buffer.
+
+        colors holds [bg, entry, exit, path, wall, logo] as uint32.
+        Rows are independent, so the outer loop runs under prange.
+        """
+        height, width = nibbles.shape
+
+        # numba's stubs type prange as non-iterable
+        for i in prange(height):  # type: ignore[attr-defined]
+            y_start = i * cs
+            y_end = y_start + cs
+
+            for j in range(width):
+                nibble = nibbles[i, j]
+                if nibble > 0x0F:
+                    continue
+
+                x_start = j * cs
+                x_end = x_start + cs
+                is_42 = nibble == 0x0F
+
+                if j == entry_x and i == entry_y:
+                    bg_color = colors[1]
+                elif j == exit_x and i == exit_y:
+                    bg_color = colors[2]
+                elif path_bitmap[i, j]:
+                    bg_color = colors[3]
+                else:
+                    bg_color = colors[0]
+
+                if not is_42:
+                    for y in range(y_start, y_end):
+                        for x in range(x_start, x_end):
+                            buf[y, x] = bg_color
+
+                wall = colors[4]
+                if nibble & 0x8:
+                    for y in range(y_start, y_end):
+                        buf[y, x_start] = wall
+                if nibble & 0x4:
+                    for x in range(x_start, x_end):
+                        buf[y_end - 1, x] = wall
+                if nibble & 0x2:
+                    for y in range(y_start, y_end):
+                        buf[y, x_end - 1] = wall
+                if nibble & 0x1:
+                    for x in range(x_start, x_end):
+                        buf[y_start, x] = wall
+
+                if is_42:
+                    logo = colors[5]
+                    for y in range(y_start + 1, y_end - 1):
+                        for x in range(x_start + 1, x_end - 1):
+                            buf[y, x] = logo
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _path_contains(path_bytes: Any, entry_x: int, entry_y: int,
+                       tx: int, ty: int, maze_width: int,
+                       maze_height: int) -> bool:
+        """Compiled path walk over the path encoded as ASCII bytes."""
+        if tx == entry_x and ty == entry_y:
+            return True
+
+        current_x, current_y = entry_x, entry_y
+
+        for k in range(path_bytes.shape[0]):
+            c = path_bytes[k]
+            if c == 78:      # 'N'
+                current_y -= 1
+            elif c == 83:    # 'S'
+                current_y += 1
+            elif c == 69:    # 'E'
+                current_x += 1
+            elif c == 87:    # 'W'
+                current_x -= 1
+
+            if not (0 <= current_x < maze_width and
+                    0 <= current_y < maze_height):
+                continue
+
+            if current_x == tx and current_y == ty:
+                return True
+
+        return False
+
+
 def is_cell_in_path(x: int, y: int, entry_coords: Tuple[int, int],
                     path: str, maze_width: int, maze_height: int) -> bool:
     """
@@ -432,22 +639,21 @@ def is_cell_in_path(x: int, y: int, entry_coords: Tuple[int, int],
     """
     entry_x, entry_y = entry_coords[0] - 1, entry_coords[1] - 1
 
+    if NUMBA_AVAILABLE:
+        path_bytes = np.frombuffer(path.encode('ascii'), np.uint8)
+        return bool(_path_contains(path_bytes, entry_x, entry_y,
+                                   x, y, maze_width, maze_height))
+
     if (x, y) == (entry_x, entry_y):
         return True
 
     current_x, current_y = entry_x, entry_y
 
-    direction_map = {
-        'N': (0, -1),
-        'S': (0, 1),
-        'E': (1, 0),
-        'W': (-1, 0)
-    }
-
     for direction in path:
-        dx, dy = direction_map.get(direction, (0, 0))
-        current_x += dx
-        current_y += dy
+        code = ord(direction)
+        if code < 128:
+            current_x += DX[code]
+            current_y += DY[code]
 
         if not (0 <= current_x < maze_width and 0 <= current_y < maze_height):
             continue
@@ -458,9 +664,44 @@ def is_cell_in_path(x: int, y: int, entry_coords: Tuple[int, int],
     return False
 
 
+def compute_path_cells(entry_coords: Tuple[int, int], path: str,
+                       maze_width: int,
+                       maze_height: int) -> set:
+    """
+    Computes the set of cells crossed by the solution path.
+
+    Walking the path once and testing membership afterwards avoids
+    re-walking the whole path for every cell during drawing.
+
+    Args:
+        entry_coords: Entry coordinates (1-based).
+        path: String with the solution path.
+        maze_width: Width of the maze.
+        maze_height: Height of the maze.
+
+    Returns:
+        Set of (x, y) coordinates (0-based) on the path.
+    """
+    current_x, current_y = entry_coords[0] - 1, entry_coords[1] - 1
+
+    cells = set()
+    if 0 <= current_x < maze_width and 0 <= current_y < maze_height:
+        cells.add((current_x, current_y))
+
+    for direction in path:
+        code = ord(direction)
+        if code < 128:
+            current_x += DX[code]
+            current_y += DY[code]
+
+        if 0 <= current_x < maze_width and 0 <= current_y < maze_height:
+            cells.add((current_x, current_y))
+
+    return cells
+
+
 def get_cell_background_color(j: int, i: int, is_entry: bool, is_exit: bool,
-                              show_path: bool, entry_coords: Tuple[int, int],
-                              path: str, width: int, height: int,
+                              show_path: bool, path_cells: set,
                               is_42: bool) -> int:
     """
     Determines the background color of a cell.
@@ -471,10 +712,7 @@ def get_cell_background_color(j: int, i: int, is_entry: bool, is_exit: bool,
         is_entry: Whether this is the entry cell.
         is_exit: Whether this is the exit cell.
         show_path: Whether the solution path should be displayed.
-        entry_coords: Entry coordinates.
-        path: String with the solution path.
-        width: Width of the maze.
-        height: Height of the maze.
+        path_cells: Precomputed set of path cells (see compute_path_cells).
         is_42: Whether the cell is part of the '42' pattern.
 
     Returns:
@@ -486,16 +724,59 @@ def get_cell_background_color(j: int, i: int, is_entry: bool, is_exit: bool,
         return DEFAULT_EXIT_COLOR
     elif is_42:
         return DEFAULT_PATTERN_42_COLOR
-    elif show_path and is_cell_in_path(j, i, entry_coords,
-                                       path, width, height):
+    elif show_path and (j, i) in path_cells:
         return DEFAULT_PATH_COLOR
     else:
         return DEFAULT_BG_COLOR
 
 
+def create_image(mlx_ptr: Any, width: int,
+                 height: int) -> Optional[Tuple[Any, Any]]:
+    """
+    Creates an MLX image sized to the maze and maps its pixel buffer.
+
+    Drawing into the buffer and blitting it once per frame avoids one
+    FFI call per pixel through mlx_pixel_put.
+
+    Args:
+        mlx_ptr: Pointer to MLX.
+        width: Maze width in cells.
+        height: Maze height in cells.
+
+    Returns:
+        Tuple (img_ptr, buffer) where buffer is a writable uint32 view
+        of shape (height*CELL_SIZE, width*CELL_SIZE), or None if the
+        image could not be created.
+    """
+    if not MLX_AVAILABLE or mlx_instance is None or not NUMPY_AVAILABLE:
+        return None
+
+    screen_width = width * CELL_SIZE
+    screen_height = height * CELL_SIZE
+
+    try:
+        img_ptr = mlx_instance.mlx_new_image(
+            mlx_ptr, screen_width, screen_height
+        )
+        # The binding returns (memoryview, bpp, size_line, format);
+        # size_line may include scanline padding beyond width*4.
+        data, bpp, size_line, _ = mlx_instance.mlx_get_data_addr(img_ptr)
+        if bpp != 32:
+            return None
+        buf = np.frombuffer(data, dtype=np.uint32)
+        buf = buf.reshape(screen_height, size_line // 4)
+        buf = buf[:, :screen_width]
+        if not buf.flags.writeable:
+            return None
+        return img_ptr, buf
+    except Exception as e:
+        print(f"Advertencia: no se pudo crear la imagen mlx: {e}")
+        return None
+
+
 def draw_cell_background(mlx_ptr: Any, win_ptr: Any, x_start: int,
                          y_start: int, x_end: int, y_end: int,
-                         color: int) -> None:
+                         color: int, buf: Any = None) -> None:
     """
     Draws the background of a cell.
 
@@ -507,7 +788,12 @@ def draw_cell_background(mlx_ptr: Any, win_ptr: Any, x_start: int,
         x_end: Ending x coordinate.
         y_end: Ending y coordinate.
         color: Background color.
+        buf: Image buffer to draw into (optional).
     """
+    if buf is not None:
+        buf[y_start:y_end, x_start:x_end] = color
+        return
+
     if mlx_instance is None:
         return
 
@@ -518,7 +804,7 @@ def draw_cell_background(mlx_ptr: Any, win_ptr: Any, x_start: int,
 
 def draw_wall(mlx_ptr: Any, win_ptr: Any, x_start: int, y_start: int,
               x_end: int, y_end: int, wall_type: str,
-              wall_color: int) -> None:
+              wall_color: int, buf: Any = None) -> None:
     """
     Draws a wall of a cell.
 
@@ -531,25 +817,40 @@ def draw_wall(mlx_ptr: Any, win_ptr: Any, x_start: int, y_start: int,
         y_end: Ending y coordinate.
         wall_type: Wall type ('N', 'S', 'E', 'W').
         wall_color: Wall color.
+        buf: Image buffer to draw into (optional).
     """
-    if mlx_instance is None:
+    if buf is not None:
+        if wall_type == 'W':
+            buf[y_start:y_end, x_start] = wall_color
+        elif wall_type == 'S':
+            buf[y_end - 1, x_start:x_end] = wall_color
+        elif wall_type == 'E':
+            buf[y_start:y_end, x_end - 1] = wall_color
+        elif wall_type == 'N':
+            buf[y_start, x_start:x_end] = wall_color
         return
 
-    wall_positions = {
-        'W': lambda: [(x_start, y) for y in range(y_start, y_end)],
-        'S': lambda: [(x, y_end - 1) for x in range(x_start, x_end)],
-        'E': lambda: [(x_end - 1, y) for y in range(y_start, y_end)],
-        'N': lambda: [(x, y_start) for x in range(x_start, x_end)]
-    }
+    if mlx_instance is None:
+        return
 
-    if wall_type in wall_positions:
-        for x, y in wall_positions[wall_type]():
-            mlx_instance.mlx_pixel_put(mlx_ptr, win_ptr, x, y, wall_color)
+    pixel_put = mlx_instance.mlx_pixel_put
+    if wall_type == 'W':
+        for y in range(y_start, y_end):
+            pixel_put(mlx_ptr, win_ptr, x_start, y, wall_color)
+    elif wall_type == 'S':
+        for x in range(x_start, x_end):
+            pixel_put(mlx_ptr, win_ptr, x, y_end - 1, wall_color)
+    elif wall_type == 'E':
+        for y in range(y_start, y_end):
+            pixel_put(mlx_ptr, win_ptr, x_end - 1, y, wall_color)
+    elif wall_type == 'N':
+        for x in range(x_start, x_end):
+            pixel_put(mlx_ptr, win_ptr, x, y_start, wall_color)
 
 
 def draw_cell_walls(mlx_ptr: Any, win_ptr: Any, x_start: int, y_start: int,
                     x_end: int, y_end: int, hex_value: int,
-                    wall_color: int) -> None:
+                    wall_color: int, buf: Any = None) -> None:
     """
     Draws the walls of a cell based on its hexadecimal value.
 
@@ -566,6 +867,7 @@ def draw_cell_walls(mlx_ptr: Any, win_ptr: Any, x_start: int, y_start: int,
         y_end: Ending y coordinate.
         hex_value: Hexadecimal value of the cell.
         wall_color: Wall color.
+        buf: Image buffer to draw into (optional).
     """
     wall_bits = [
         ('N', 0b0001),
@@ -577,11 +879,12 @@ def draw_cell_walls(mlx_ptr: Any, win_ptr: Any, x_start: int, y_start: int,
     for wall_type, bit_mask in wall_bits:
         if hex_value & bit_mask:
             draw_wall(mlx_ptr, win_ptr, x_start, y_start, x_end, y_end,
-                      wall_type, wall_color)
+                      wall_type, wall_color, buf)
 
 
 def draw_closed_cell_fill(mlx_ptr: Any, win_ptr: Any, x_start: int,
-                          y_start: int, x_end: int, y_end: int) -> None:
+                          y_start: int, x_end: int, y_end: int,
+                          buf: Any = None) -> None:
     """
     Draws the fill of a fully closed cell (part of the '42' pattern).
 
@@ -592,16 +895,168 @@ def draw_closed_cell_fill(mlx_ptr: Any, win_ptr: Any, x_start: int,
         y_start: Starting y coordinate.
         x_end: Ending x coordinate.
         y_end: Ending y coordinate.
+        buf: Image buffer to draw into (optional).
     """
+    color = get_current_logo_color()
+
+    if buf is not None:
+        buf[y_start + 1:y_end - 1, x_start + 1:x_end - 1] = color
+        return
+
     if mlx_instance is None:
         return
 
-    color = get_current_logo_color()
     for x in range(x_start + 1, x_end - 1):
         for y in range(y_start + 1, y_end - 1):
             mlx_instance.mlx_pixel_put(mlx_ptr, win_ptr, x, y, color)
 
 
+def draw_maze_buffer(buf: Any, nibbles: Any, path_cells: set,
+                     entry_coords: Tuple[int, int],
+                     exit_coords: Tuple[int, int], show_path: bool,
+                     wall_color: int) -> None:
+    """
+    Draws the maze into the image buffer using wall-bit mask grids.
+
+    The four wall masks are derived from the nibble array with
+    vectorized bit operations; each wall is then a single row or
+    column slice assignment instead of a draw_wall call per wall.
+
+    Args:
+        buf: uint32 image buffer of shape (H*CELL_SIZE, W*CELL_SIZE).
+        nibbles: uint8 array with the cell nibbles (see decode_hex_grid).
+        path_cells: Precomputed set of path cells.
+        entry_coords: Entry coordinates (1-based).
+        exit_coords: Exit coordinates (1-based).
+        show_path: Whether the solution path should be displayed.
+        wall_color: Wall color.
+    """
+    height, width = nibbles.shape
+    cs = CELL_SIZE
+    ex, ey = entry_coords[0] - 1, entry_coords[1] - 1
+    fx, fy = exit_coords[0] - 1, exit_coords[1] - 1
+
+    if NUMBA_AVAILABLE:
+        path_bitmap = np.zeros((height, width), np.bool_)
+        if show_path:
+            for cx, cy in path_cells:
+                path_bitmap[cy, cx] = True
+
+        colors = np.array([DEFAULT_BG_COLOR, DEFAULT_ENTRY_COLOR,
+                           DEFAULT_EXIT_COLOR, DEFAULT_PATH_COLOR,
+                           wall_color, get_current_logo_color()],
+                          dtype=np.uint32)
+        _render_maze(nibbles, path_bitmap, ex, ey, fx, fy,
+                     buf, cs, colors)
+        return
+
+    valid = nibbles <= 0x0F
+    north_mask = (nibbles & 0x1) != 0
+    east_mask = (nibbles & 0x2) != 0
+    south_mask = (nibbles & 0x4) != 0
+    west_mask = (nibbles & 0x8) != 0
+    is_42_grid = nibbles == 0x0F
+
+    logo_color = get_current_logo_color()
+
+    # Backgrounds as bulk fills, most specific color last.
+    buf[:] = DEFAULT_BG_COLOR
+
+    if show_path:
+        for cx, cy in path_cells:
+            buf[cy * cs:(cy + 1) * cs,
+                cx * cs:(cx + 1) * cs] = DEFAULT_PATH_COLOR
+
+    if 0 <= fx < width and 0 <= fy < height:
+        buf[fy * cs:(fy + 1) * cs,
+            fx * cs:(fx + 1) * cs] = DEFAULT_EXIT_COLOR
+
+    if 0 <= ex < width and 0 <= ey < height:
+        buf[ey * cs:(ey + 1) * cs,
+            ex * cs:(ex + 1) * cs] = DEFAULT_ENTRY_COLOR
+
+    for i in range(height):
+        for j in range(width):
+            if not valid[i, j]:
+                continue
+
+            x_start = j * cs
+            y_start = i * cs
+            x_end = x_start + cs
+            y_end = y_start + cs
+
+            if west_mask[i, j]:
+                buf[y_start:y_end, x_start] = wall_color
+            if south_mask[i, j]:
+                buf[y_end - 1, x_start:x_end] = wall_color
+            if east_mask[i, j]:
+                buf[y_start:y_end, x_end - 1] = wall_color
+            if north_mask[i, j]:
+                buf[y_start, x_start:x_end] = wall_color
+
+            if is_42_grid[i, j]:
+                buf[y_start + 1:y_end - 1,
+                    x_start + 1:x_end - 1] = logo_color
+
+
+def redraw_walls_only(state: Dict[str, Any], wall_color: int) -> bool:
+    """
+    Re-stamps only the wall pixels with a new color and re-blits.
+
+    Cycling the wall color leaves backgrounds, path and 42 fills
+    untouched, so repainting just the wall slices from the cached
+    nibble grid avoids a full redraw.
+
+    Args:
+        state: Maze state with cached 'buf' and 'nibbles'.
+        wall_color: New wall color.
+
+    Returns:
+        True if the incremental redraw was done, False if the caller
+        must fall back to a full draw_maze.
+    """
+    if mlx_instance is None:
+        return False
+
+    buf = state.get('buf')
+    nibbles = state.get('nibbles')
+    if buf is None or nibbles is None:
+        return False
+
+    height, width = nibbles.shape
+    cs = CELL_SIZE
+
+    north_mask = (nibbles & 0x1) != 0
+    east_mask = (nibbles & 0x2) != 0
+    south_mask = (nibbles & 0x4) != 0
+    west_mask = (nibbles & 0x8) != 0
+    valid = nibbles <= 0x0F
+
+    for i in range(height):
+        for j in range(width):
+            if not valid[i, j]:
+                continue
+
+            x_start = j * cs
+            y_start = i * cs
+            x_end = x_start + cs
+            y_end = y_start + cs
+
+            if west_mask[i, j]:
+                buf[y_start:y_end, x_start] = wall_color
+            if south_mask[i, j]:
+                buf[y_end - 1, x_start:x_end] = wall_color
+            if east_mask[i, j]:
+                buf[y_start:y_end, x_end - 1] = wall_color
+            if north_mask[i, j]:
+                buf[y_start, x_start:x_end] = wall_color
+
+    mlx_instance.mlx_put_image_to_window(
+        state['mlx_ptr'], state['win_ptr'], state['img_ptr'], 0, 0
+    )
+    return True
+
+
 def draw_maze(maze_state: Dict[str, Any]) -> None:
     """
     Draws the maze in the existing window.
@@ -621,42 +1076,109 @@ def draw_maze(maze_state: Dict[str, Any]) -> None:
     entry_coords = maze_state['entry_coords']
     exit_coords = maze_state['exit_coords']
     path = maze_state['path']
+    buf = maze_state.get('buf')
 
     wall_color = get_current_wall_color()
 
+    path_cells = maze_state.get('path_cells')
+    if path_cells is None:
+        path_cells = compute_path_cells(entry_coords, path, width, height)
+        maze_state['path_cells'] = path_cells
+
+    nibbles = maze_state.get('nibbles')
+    if nibbles is None:
+        nibbles = decode_hex_grid(hex_lines, width, height)
+        maze_state['nibbles'] = nibbles
+
+    if buf is not None and nibbles is not None:
+        draw_maze_buffer(buf, nibbles, path_cells, entry_coords,
+                         exit_coords, show_path_state, wall_color)
+        mlx_instance.mlx_put_image_to_window(
+            mlx_ptr, win_ptr, maze_state['img_ptr'], 0, 0
+        )
+        return
+
+    cs = CELL_SIZE
+
     for i in range(height):
         line = hex_lines[i]
+        nibble_row = nibbles[i] if nibbles is not None else None
 
         for j in range(width):
-            x_start = j * CELL_SIZE
-            y_start = i * CELL_SIZE
-            x_end = x_start + CELL_SIZE
-            y_end = y_start + CELL_SIZE
+            x_start = j * cs
+            y_start = i * cs
+            x_end = x_start + cs
+            y_end = y_start + cs
+
+            if nibble_row is not None:
+                hex_value = nibble_row[j].item()
+            else:
+                hex_char = line[j].upper()
+                if hex_char not in '0123456789ABCDEF':
+                    continue
+                hex_value = int(hex_char, 16)
+
+            if hex_value == 255:
+                continue
+            is_42_cell = (hex_value == 0b1111)
+
+            # A 42 cell is fully covered by its four walls plus the
+            # interior fill, so its background paint would be overwritten.
+            if not is_42_cell:
+                bg_color = get_cell_background_color(
+                    j, i, False, False, show_path_state,
+                    path_cells, is_42_cell
+                )
+                draw_cell_background(mlx_ptr, win_ptr, x_start, y_start,
+                                     x_end, y_end, bg_color, buf)
+
+            draw_cell_walls(mlx_ptr, win_ptr, x_start, y_start, x_end,
+                            y_end, hex_value, wall_color, buf)
 
-            is_entry = (j + 1 == entry_coords[0] and i + 1 == entry_coords[1])
-            is_exit = (j + 1 == exit_coords[0] and i + 1 == exit_coords[1])
+            if is_42_cell:
+                draw_closed_cell_fill(mlx_ptr, win_ptr, x_start, y_start,
+                                      x_end, y_end, buf)
+
+    # Entry and exit are single cells: stamp them after the main loop
+    # instead of comparing every cell against them, then redraw their
+    # walls so they stay visible.
+    stamp_cells = (
+        (exit_coords[0] - 1, exit_coords[1] - 1, DEFAULT_EXIT_COLOR),
+        (entry_coords[0] - 1, entry_coords[1] - 1, DEFAULT_ENTRY_COLOR),
+    )
+    for cx, cy, color in stamp_cells:
+        if not (0 <= cx < width and 0 <= cy < height):
+            continue
 
-            hex_char = line[j].upper()
+        if nibbles is not None:
+            hex_value = int(nibbles[cy, cx])
+        else:
+            hex_char = hex_lines[cy][cx].upper()
             if hex_char not in '0123456789ABCDEF':
                 continue
-
             hex_value = int(hex_char, 16)
-            is_42_cell = (hex_value == 0b1111)
 
-            bg_color = get_cell_background_color(
-                j, i, is_entry, is_exit, show_path_state,
-                entry_coords, path, width, height, is_42_cell
-            )
+        if hex_value > 0x0F:
+            continue
+
+        x_start, y_start = cx * cs, cy * cs
+        x_end, y_end = x_start + cs, y_start + cs
 
+        if hex_value != 0x0F:
             draw_cell_background(mlx_ptr, win_ptr, x_start, y_start,
-                                 x_end, y_end, bg_color)
+                                 x_end, y_end, color, buf)
 
-            draw_cell_walls(mlx_ptr, win_ptr, x_start, y_start, x_end,
-                            y_end, hex_value, wall_color)
+        draw_cell_walls(mlx_ptr, win_ptr, x_start, y_start, x_end,
+                        y_end, hex_value, wall_color, buf)
 
-            if is_42_cell:
-                draw_closed_cell_fill(mlx_ptr, win_ptr, x_start, y_start,
-                                      x_end, y_end)
+        if hex_value == 0x0F:
+            draw_closed_cell_fill(mlx_ptr, win_ptr, x_start, y_start,
+                                  x_end, y_end, buf)
+
+    if buf is not None:
+        mlx_instance.mlx_put_image_to_window(
+            mlx_ptr, win_ptr, maze_state['img_ptr'], 0, 0
+        )
 
 
 def create_window(width: int, height: int) -> Optional[Tuple[Any, Any]]:
@@ -811,12 +1333,14 @@ def move_entry(dx: int, dy: int) -> None:
             maze_state['exit_coords']
         )
         maze_state['path'] = new_path
+        maze_state['path_cells'] = None
         print(f"Entrada movida a {maze_state['entry_coords']} – "
               f"Camino: {len(new_path)} pasos")
         if mlx_instance is None:
             return
-        mlx_instance.mlx_clear_window(maze_state['mlx_ptr'],
-                                      maze_state['win_ptr'])
+        if maze_state.get('buf') is None:
+            mlx_instance.mlx_clear_window(maze_state['mlx_ptr'],
+                                          maze_state['win_ptr'])
         draw_maze(maze_state)
 
 
@@ -845,9 +1369,22 @@ def visualize_maze(maze_data: Dict[str, Any]) -> None:
             sys.exit(1)
         mlx_ptr, win_ptr = window_result
 
+    if (maze_state and
+            maze_state.get('buf') is not None and
+            maze_state.get('width') == maze_data['width'] and
+            maze_state.get('height') == maze_data['height']):
+        img_ptr = maze_state['img_ptr']
+        buf = maze_state['buf']
+    else:
+        image_result = create_image(mlx_ptr, maze_data['width'],
+                                    maze_data['height'])
+        img_ptr, buf = image_result if image_result else (None, None)
+
     maze_state = {
         'mlx_ptr': mlx_ptr,
         'win_ptr': win_ptr,
+        'img_ptr': img_ptr,
+        'buf': buf,
         'hex_lines': maze_data['hex_lines'],
         'width': maze_data['width'],
         'height': maze_data['height'],
@@ -932,21 +1469,26 @@ def handle_key_event(keynum: int, mystuff: Any) -> None:
         if maze_state:
             if mlx_instance is None:
                 return
-            mlx_instance.mlx_clear_window(mlx_ptr, win_ptr)
+            if maze_state.get('buf') is None:
+                mlx_instance.mlx_clear_window(mlx_ptr, win_ptr)
             draw_maze(maze_state)
     elif keynum == KEY_C:
         cycle_wall_color()
         if maze_state:
             if mlx_instance is None:
                 return
-            mlx_instance.mlx_clear_window(mlx_ptr, win_ptr)
+            if redraw_walls_only(maze_state, get_current_wall_color()):
+                return
+            if maze_state.get('buf') is None:
+                mlx_instance.mlx_clear_window(mlx_ptr, win_ptr)
             draw_maze(maze_state)
     elif keynum == KEY_L:
         cycle_logo_color()
         if maze_state:
             if mlx_instance is None:
                 return
-            mlx_instance.mlx_clear_window(mlx_ptr, win_ptr)
+            if maze_state.get('buf') is None:
+                mlx_instance.mlx_clear_window(mlx_ptr, win_ptr)
             draw_maze(maze_state)
     elif keynum == KEY_1:
         if mlx_instance is None:
@@ -967,7 +1509,7 @@ def handle_key_event(keynum: int, mystuff: Any) -> None:
 def generate_maze() -> None:
     """Generates a new maze based on the configuration."""
     try:
-        config = parse_config(sys.argv[1])
+        config = get_config()
         print("✓ Configuración parseada correctamente")
 
         print("Generando laberinto...")
@@ -1005,13 +1547,13 @@ def generate_maze() -> None:
 def see_maze() -> None:
     """Loads and visualizes a maze from the output file."""
     try:
-        config = parse_config(sys.argv[1])
+        config = get_config()
 
         if not config or not config.get("OUTPUT_FILE"):
             raise ConfigError("Archivo de salida no especificado")
 
         hex_lines, width, height, entry_coords, exit_coords, path = \
-            parse_maze_file(config["OUTPUT_FILE"])
+            parse_maze_file_cached(config["OUTPUT_FILE"])
 
         maze_data = {
             'hex_lines': hex_lines,
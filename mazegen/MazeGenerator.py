@@ -2,6 +2,20 @@ import random
 from typing import Dict, List, Optional, Tuple, Deque
 from collections import deque
 
+# (dy, dx, pared actual, pared vecina, letra del paso) para el BFS
+_BFS_DIRS = (
+    (-1, 0, "n", "s", "N"),
+    (1, 0, "s", "n", "S"),
+    (0, 1, "e", "w", "E"),
+    (0, -1, "w", "e", "W"),
+)
+
+# (dx, dy, dirección) para el backtracking
+_DFS_DIRS = ((0, -1, "N"), (0, 1, "S"), (-1, 0, "W"), (1, 0, "E"))
+
+# Dígitos hexadecimales indexados por el nibble de paredes cerradas
+_HEX_LUT = "0123456789ABCDEF"
+
 
 class Cell:
     """
@@ -18,6 +32,8 @@ class Cell:
         is_42: Indica si la celda es parte del patrón '42'.
     """
 
+    __slots__ = ("x", "y", "n", "s", "e", "w", "visited", "is_42")
+
     def __init__(self, x: int, y: int) -> None:
         """
         Inicializa una celda con todas las paredes cerradas.
@@ -142,23 +158,24 @@ class MazeGenerator:
         queue: Deque[Tuple[int, int]] = deque([(ey, ex)])
         visited[ey][ex] = True
 
+        height, width = self.height, self.width
+
         while queue:
             y, x = queue.popleft()
             if y == fy and x == fx:
                 break
 
-            neighbors = [
-                (y - 1, x, "n", "s", "N"),
-                (y + 1, x, "s", "n", "S"),
-                (y, x + 1, "e", "w", "E"),
-                (y, x - 1, "w", "e", "W"),
-            ]
-
-            for ny, nx, cw, nw, direction in neighbors:
-                if 0 <= ny < self.height and 0 <= nx < self.width:
+            for dy, dx, cw, nw, direction in _BFS_DIRS:
+                ny, nx = y + dy, x + dx
+                if 0 <= ny < height and 0 <= nx < width:
                     self._process_neighbor(y, x, ny, nx, cw, nw,
                                            direction, visited, prev, queue)
 
+            # Corta en cuanto se descubre la salida, sin esperar a que
+            # llegue a la cabeza de la cola.
+            if visited[fy][fx]:
+                break
+
         if not visited[fy][fx]:
             return ""
 
@@ -233,12 +250,8 @@ class MazeGenerator:
     def _get_neighbors(self, x: int, y: int,
                        maze: List[List[Cell]]) -> List[Tuple[int, int, str]]:
         """Obtiene vecinos válidos de una celda."""
-        potential = [
-            (x, y - 1, "N"), (x, y + 1, "S"),
-            (x - 1, y, "W"), (x + 1, y, "E"),
-        ]
-        return [(nx, ny, d) for nx, ny, d in potential
-                if self._is_valid_neighbor(nx, ny, maze)]
+        return [(x + dx, y + dy, d) for dx, dy, d in _DFS_DIRS
+                if self._is_valid_neighbor(x + dx, y + dy, maze)]
 
     def _open_wall(self, current: Cell, nx: int, ny: int,
                    direction: str, maze: List[List[Cell]]) -> None:
@@ -253,15 +266,29 @@ class MazeGenerator:
         setattr(neighbor, nw, True)
 
     def _backtrack(self, x: int, y: int, maze: List[List[Cell]]) -> None:
-        """Algoritmo de backtracking recursivo."""
+        """
+        Algoritmo de backtracking iterativo con pila explícita.
+
+        Evita el RecursionError en laberintos grandes donde la pila de
+        llamadas de Python se agota.
+        """
+        stack: List[Tuple[int, int]] = [(x, y)]
         maze[y][x].visited = True
-        neighbors = self._get_neighbors(x, y, maze)
-        random.shuffle(neighbors)
 
-        for nx, ny, direction in neighbors:
-            if not maze[ny][nx].visited and not maze[ny][nx].is_42:
-                self._open_wall(maze[y][x], nx, ny, direction, maze)
-                self._backtrack(nx, ny, maze)
+        while stack:
+            cx, cy = stack[-1]
+            neighbors = self._get_neighbors(cx, cy, maze)
+            unvisited = [(nx, ny, d) for nx, ny, d in neighbors
+                         if not maze[ny][nx].visited]
+
+            if unvisited:
+                pick = random.randrange(len(unvisited))
+                nx, ny, direction = unvisited[pick]
+                self._open_wall(maze[cy][cx], nx, ny, direction, maze)
+                maze[ny][nx].visited = True
+                stack.append((nx, ny))
+            else:
+                stack.pop()
 
     def _find_start_cell(self, maze: List[List[Cell]],
                          entry: Tuple[int, int]) -> Tuple[int, int]:
@@ -322,13 +349,5 @@ class MazeGenerator:
 
     def _cell_to_hex(self, cell: Cell) -> str:
         """Convierte una celda a representación hexadecimal."""
-        value = 0
-        if not cell.n:
-            value |= 1
-        if not cell.e:
-            value |= 2
-        if not cell.s:
-            value |= 4
-        if not cell.w:
-            value |= 8
-        return format(value, "X")
+        return _HEX_LUT[(not cell.n) | ((not cell.e) << 1) |
+                        ((not cell.s) << 2) | ((not cell.w) << 3)]
@@ -1,7 +1,123 @@
 import random
-from typing import Dict, List, Optional, Tuple, Deque
+from typing import List, Optional, Tuple, Deque
 from collections import deque
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Bit layout of a cell in the packed wall grid. A set wall bit means
+# the wall is OPEN (there is a passage), matching Cell semantics.
+N_BIT = 0x01
+S_BIT = 0x02
+E_BIT = 0x04
+W_BIT = 0x08
+VISITED_BIT = 0x10
+IS42_BIT = 0x20
+
+# Internal wall nibble (set bit = OPEN wall) -> ASCII hex digit of the
+# external encoding (set bit = CLOSED wall, N=0x1 E=0x2 S=0x4 W=0x8).
+# A fully closed cell maps to "F".
+_HEX_CODES = np.zeros(16, dtype=np.uint8)
+for _flags in range(16):
+    _value = ((0 if _flags & N_BIT else 0x1) |
+              (0 if _flags & E_BIT else 0x2) |
+              (0 if _flags & S_BIT else 0x4) |
+              (0 if _flags & W_BIT else 0x8))
+    _HEX_CODES[_flags] = ord("0123456789ABCDEF"[_value])
+del _flags, _value
+
+# (dy, dx, current wall bit, neighbor wall bit, ASCII step code)
+_BFS_DIRS = (
+    (-1, 0, N_BIT, S_BIT, 78),   # N
+    (1, 0, S_BIT, N_BIT, 83),    # S
+    (0, 1, E_BIT, W_BIT, 69),    # E
+    (0, -1, W_BIT, E_BIT, 87),   # W
+)
+
+# (dx, dy, current wall bit, neighbor wall bit)
+_DFS_DIRS = (
+    (0, -1, N_BIT, S_BIT), (0, 1, S_BIT, N_BIT),
+    (-1, 0, W_BIT, E_BIT), (1, 0, E_BIT, W_BIT),
+)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _backtrack_kernel(walls: np.ndarray, start_x: int, start_y: int,
+                          seed: np.uint64) -> None:
+        """Compiled iterative DFS over the packed wall grid.
+
+        Uses an explicit stack and an inlined xorshift64 generator to
+        pick the next unvisited neighbor, so the whole traversal runs
+        without touching the interpreter or the random module.
+
+        Neighbors inside the current 64x64 tile are preferred over
+        cross-tile moves, so on mazes larger than the cache the walk
+        stays within one tile until it is exhausted instead of
+        pointer-chasing across the whole grid. The result is still a
+        uniform-choice DFS tree; only the candidate pool is biased.
+        """
+        height, width = walls.shape
+
+        stack = np.empty((height * width, 2), np.int32)
+        top = 0
+        stack[0, 0] = start_x
+        stack[0, 1] = start_y
+        walls[start_y, start_x] |= VISITED_BIT
+
+        state = seed | np.uint64(1)
+        dx = (0, 0, -1, 1)
+        dy = (-1, 1, 0, 0)
+        cw = (N_BIT, S_BIT, W_BIT, E_BIT)
+        nw = (S_BIT, N_BIT, E_BIT, W_BIT)
+        candidates = np.empty(4, np.int64)
+
+        while top >= 0:
+            x = stack[top, 0]
+            y = stack[top, 1]
+
+            # Same-tile candidates are packed at the front of the
+            # buffer; in_tile counts them.
+            count = 0
+            in_tile = 0
+            for d in range(4):
+                nx = x + dx[d]
+                ny = y + dy[d]
+                if (0 <= nx < width and 0 <= ny < height and
+                        not walls[ny, nx] & (VISITED_BIT | IS42_BIT)):
+                    if (nx >> 6) == (x >> 6) and (ny >> 6) == (y >> 6):
+                        candidates[count] = candidates[in_tile]
+                        candidates[in_tile] = d
+                        in_tile += 1
+                    else:
+                        candidates[count] = d
+                    count += 1
+
+            if count == 0:
+                top -= 1
+                continue
+
+            # xorshift64; taking one uniform pick is equivalent to
+            # shuffling the candidates and using the first. Cross-tile
+            # moves are taken only when no same-tile neighbor is left.
+            pool = in_tile if in_tile > 0 else count
+            state ^= state << np.uint64(13)
+            state ^= state >> np.uint64(7)
+            state ^= state << np.uint64(17)
+            d = candidates[int(state % np.uint64(pool))]
+
+            nx = x + dx[d]
+            ny = y + dy[d]
+            walls[y, x] |= cw[d]
+            walls[ny, nx] |= nw[d] | VISITED_BIT
+            top += 1
+            stack[top, 0] = nx
+            stack[top, 1] = ny
+
 
 class Cell:
     """
@@ -18,6 +134,8 @@ class Cell:
         is_42: Whether the cell is part of the '42' pattern.
     """
 
+    __slots__ = ("x", "y", "n", "s", "e", "w", "visited", "is_42")
+
     def __init__(self, x: int, y: int) -> None:
         """
         Initializes a cell with all walls closed.
@@ -45,6 +163,12 @@ class MazeGenerator:
     An iterative version is used to avoid recursion errors on large
     mazes (FIX 7).
 
+    The maze is stored as a packed numpy uint8 grid, one byte per cell
+    holding the four wall bits plus the visited/is_42 flags, instead of
+    a matrix of Cell objects: neighbor checks become array loads
+    instead of attribute lookups and the memory per cell drops from a
+    full Python object to a single byte.
+
     Example:
         >>> gen = MazeGenerator(width=20, height=15, seed=42)
         >>> maze = gen.generate(entry=(1, 1), exit_=(20, 15))
@@ -56,7 +180,7 @@ class MazeGenerator:
         height: Height of the maze in cells.
         perfect: If True, generates a perfect maze.
         seed: Seed for reproducibility (optional).
-        maze: Matrix of cells of the generated maze.
+        walls: Packed uint8 grid of the generated maze.
     """
 
     PATTERN_42 = [
@@ -68,6 +192,8 @@ class MazeGenerator:
     ]
     PATTERN_HEIGHT = 5
     PATTERN_WIDTH = 7
+    # Pattern as an IS42_BIT stamp, OR-able onto the wall grid in one go
+    PATTERN_42_STAMP = np.array(PATTERN_42, dtype=np.uint8) * IS42_BIT
 
     def __init__(self, width: int, height: int, perfect: bool = True,
                  seed: Optional[int] = None) -> None:
@@ -84,13 +210,14 @@ class MazeGenerator:
         self.height = height
         self.perfect = perfect
         self.seed = seed
-        self.maze: Optional[List[List[Cell]]] = None
+        self.walls: Optional[np.ndarray] = None
+        self._cell_cache: Optional[List[List[Cell]]] = None
 
         if self.seed is not None:
             random.seed(self.seed)
 
     def generate(self, entry: Tuple[int, int],
-                 exit_: Tuple[int, int]) -> List[List[Cell]]:
+                 exit_: Tuple[int, int]) -> np.ndarray:
         """
         Generates the maze using iterative backtracking.
 
@@ -99,18 +226,19 @@ class MazeGenerator:
             exit_: Exit coordinates in 1-based index (x, y).
 
         Returns:
-            Matrix of cells of the generated maze.
+            Packed uint8 grid of the generated maze.
         """
         entry_0 = (entry[0] - 1, entry[1] - 1)
 
-        maze = self._create_closed_maze()
-        self._add_42_pattern(maze)
-        start_x, start_y = self._find_start_cell(maze, entry_0)
+        walls = self._create_closed_maze()
+        self._add_42_pattern(walls)
+        start_x, start_y = self._find_start_cell(walls, entry_0)
         # FIX 7: Use iterative version to avoid RecursionError on large mazes
-        self._backtrack_iterative(start_x, start_y, maze)
+        self._backtrack_iterative(start_x, start_y, walls)
 
-        self.maze = maze
-        return maze
+        self.walls = walls
+        self._cell_cache = None
+        return walls
 
     def shortest_path(self, entry: Tuple[int, int],
                       exit_: Tuple[int, int]) -> str:
@@ -127,7 +255,7 @@ class MazeGenerator:
         Raises:
             ValueError: If the maze has not been generated yet.
         """
-        if self.maze is None:
+        if self.walls is None:
             raise ValueError("El laberinto no ha sido generado aún")
 
         ex, ey = entry[0] - 1, entry[1] - 1
@@ -138,49 +266,74 @@ class MazeGenerator:
         if not (0 <= fx < self.width and 0 <= fy < self.height):
             raise ValueError(f"Coordenadas de salida fuera de rango: {exit_}")
 
-        visited = [[False] * self.width for _ in range(self.height)]
-        prev: Dict[Tuple[int, int], Tuple[Tuple[int, int], str]] = {}
+        walls = self.walls
+        width, height = self.width, self.height
+
+        # Flat row-major visited flags; one byte per cell.
+        visited = bytearray(height * width)
+        # Predecessor of each discovered cell plus the ASCII code of the
+        # step that reached it; replaces the tuple-keyed prev dict.
+        parent = np.full((height, width, 2), -1, dtype=np.int32)
+        step = np.zeros((height, width), dtype=np.uint8)
         queue: Deque[Tuple[int, int]] = deque([(ey, ex)])
-        visited[ey][ex] = True
+        visited[ey * width + ex] = 1
 
-        while queue:
+        found = False
+        while queue and not found:
             y, x = queue.popleft()
             if y == fy and x == fx:
                 break
 
-            neighbors = [
-                (y - 1, x, "n", "s", "N"),
-                (y + 1, x, "s", "n", "S"),
-                (y, x + 1, "e", "w", "E"),
-                (y, x - 1, "w", "e", "W"),
-            ]
-
-            for ny, nx, cw, nw, direction in neighbors:
-                if 0 <= ny < self.height and 0 <= nx < self.width:
-                    self._process_neighbor(y, x, ny, nx, cw, nw,
-                                           direction, visited, prev, queue)
-
-        if not visited[fy][fx]:
+            current_flags = walls[y, x]
+            for dy, dx, cw, nw, code in _BFS_DIRS:
+                ny = y + dy
+                nx = x + dx
+                if not (0 <= ny < height and 0 <= nx < width):
+                    continue
+                neighbor_flags = walls[ny, nx]
+                if (current_flags & cw and
+                        neighbor_flags & nw and
+                        not neighbor_flags & IS42_BIT and
+                        not visited[ny * width + nx]):
+                    visited[ny * width + nx] = 1
+                    parent[ny, nx, 0] = y
+                    parent[ny, nx, 1] = x
+                    step[ny, nx] = code
+                    # Stop as soon as the exit is discovered instead
+                    # of waiting for it to reach the queue head.
+                    if ny == fy and nx == fx:
+                        found = True
+                        break
+                    queue.append((ny, nx))
+
+        if not visited[fy * width + fx]:
             return ""
 
-        path = []
-        current = (fy, fx)
-        while current != (ey, ex):
-            previous, direction = prev[current]
-            path.append(direction)
-            current = previous
+        path = bytearray()
+        y, x = fy, fx
+        while (y, x) != (ey, ex):
+            path.append(step[y, x])
+            y, x = int(parent[y, x, 0]), int(parent[y, x, 1])
 
         path.reverse()
-        return "".join(path)
+        return path.decode("ascii")
 
     def get_maze_structure(self) -> Optional[List[List[Cell]]]:
         """
         Gets the structure of the generated maze.
 
+        The Cell matrix is a read-only proxy built lazily from the
+        packed grid and cached until the next generate() call.
+
         Returns:
             Cell matrix or None if not yet generated.
         """
-        return self.maze
+        if self.walls is None:
+            return None
+
+        if self._cell_cache is None:
+            self._cell_cache = self._build_cell_matrix(self.walls)
+        return self._cell_cache
 
     def to_hex_matrix(self) -> List[str]:
         """
@@ -192,22 +345,17 @@ class MazeGenerator:
         Raises:
             ValueError: If the maze has not been generated yet.
         """
-        if self.maze is None:
+        if self.walls is None:
             raise ValueError("El laberinto no ha sido generado aún")
 
-        return ["".join(self._cell_to_hex(cell) for cell in row)
-                for row in self.maze]
+        codes = _HEX_CODES[self.walls & 0x0F]
+        return [row.tobytes().decode("ascii") for row in codes]
 
-    def _create_closed_maze(self) -> List[List[Cell]]:
+    def _create_closed_maze(self) -> np.ndarray:
         """Creates a maze with all walls closed."""
-        return [[Cell(x, y) for x in range(self.width)]
-                for y in range(self.height)]
+        return np.zeros((self.height, self.width), dtype=np.uint8)
 
-    def _close_all_walls(self, cell: Cell) -> None:
-        """Closes all walls of a cell."""
-        cell.n = cell.s = cell.e = cell.w = False
-
-    def _add_42_pattern(self, maze: List[List[Cell]]) -> None:
+    def _add_42_pattern(self, walls: np.ndarray) -> None:
         """Adds the '42' pattern to the center of the maze."""
         if (self.height < self.PATTERN_HEIGHT or
                 self.width < self.PATTERN_WIDTH):
@@ -216,120 +364,101 @@ class MazeGenerator:
         start_y = (self.height - self.PATTERN_HEIGHT) // 2
         start_x = (self.width - self.PATTERN_WIDTH) // 2
 
-        for py in range(self.PATTERN_HEIGHT):
-            for px in range(self.PATTERN_WIDTH):
-                if self.PATTERN_42[py][px] == 1:
-                    y, x = start_y + py, start_x + px
-                    if 0 <= y < self.height and 0 <= x < self.width:
-                        maze[y][x].is_42 = True
-                        self._close_all_walls(maze[y][x])
-
-    def _is_valid_neighbor(self, x: int, y: int,
-                           maze: List[List[Cell]]) -> bool:
-        """Checks if a cell is a valid neighbor."""
-        return (0 <= x < self.width and 0 <= y < self.height and
-                not maze[y][x].is_42)
-
-    def _get_neighbors(self, x: int, y: int,
-                       maze: List[List[Cell]]) -> List[Tuple[int, int, str]]:
-        """Gets valid neighbors of a cell."""
-        potential = [
-            (x, y - 1, "N"), (x, y + 1, "S"),
-            (x - 1, y, "W"), (x + 1, y, "E"),
-        ]
-        return [(nx, ny, d) for nx, ny, d in potential
-                if self._is_valid_neighbor(nx, ny, maze)]
-
-    def _open_wall(self, current: Cell, nx: int, ny: int,
-                   direction: str, maze: List[List[Cell]]) -> None:
+        walls[start_y:start_y + self.PATTERN_HEIGHT,
+              start_x:start_x + self.PATTERN_WIDTH] |= self.PATTERN_42_STAMP
+
+    def _open_wall(self, x: int, y: int, nx: int, ny: int,
+                   cw_bit: int, nw_bit: int, walls: np.ndarray) -> None:
         """Opens the wall between two adjacent cells."""
-        neighbor = maze[ny][nx]
-        wall_pairs = {
-            "N": ("n", "s"), "S": ("s", "n"),
-            "W": ("w", "e"), "E": ("e", "w")
-        }
-        cw, nw = wall_pairs[direction]
-        setattr(current, cw, True)
-        setattr(neighbor, nw, True)
+        walls[y, x] |= cw_bit
+        walls[ny, nx] |= nw_bit
 
     def _backtrack_iterative(self, start_x: int, start_y: int,
-                             maze: List[List[Cell]]) -> None:
+                             walls: np.ndarray) -> None:
         """
         Iterative backtracking algorithm using an explicit stack.
 
         FIX 7: Replaces the recursive version to avoid RecursionError
         on large mazes where Python's call stack is exhausted.
+
+        When numba is available the traversal runs in the compiled
+        _backtrack_kernel; the kernel seed is drawn from the random
+        module so seeded generators stay reproducible.
         """
+        if NUMBA_AVAILABLE:
+            seed = np.uint64(random.getrandbits(63))
+            _backtrack_kernel(walls, start_x, start_y, seed)
+            return
+
+        width, height = self.width, self.height
         stack: List[Tuple[int, int]] = [(start_x, start_y)]
-        maze[start_y][start_x].visited = True
+        walls[start_y, start_x] |= VISITED_BIT
 
         while stack:
             x, y = stack[-1]
-            neighbors = self._get_neighbors(x, y, maze)
-            unvisited = [(nx, ny, d) for nx, ny, d in neighbors
-                         if not maze[ny][nx].visited and
-                         not maze[ny][nx].is_42]
+            # Inlined validity test: one bounds check plus a single
+            # AND covering both the is_42 and visited flags.
+            unvisited = []
+            for dx, dy, cw, nw in _DFS_DIRS:
+                nx = x + dx
+                ny = y + dy
+                if (0 <= nx < width and 0 <= ny < height and
+                        not walls[ny, nx] & (IS42_BIT | VISITED_BIT)):
+                    unvisited.append((nx, ny, cw, nw))
 
             if unvisited:
-                random.shuffle(unvisited)
-                nx, ny, direction = unvisited[0]
-                self._open_wall(maze[y][x], nx, ny, direction, maze)
-                maze[ny][nx].visited = True
+                # Prefer neighbors in the current 64x64 tile to keep
+                # the working set cache-resident on large mazes.
+                in_tile = [t for t in unvisited
+                           if t[0] >> 6 == x >> 6 and t[1] >> 6 == y >> 6]
+                pool = in_tile or unvisited
+                nx, ny, cw, nw = pool[random.randrange(len(pool))]
+                self._open_wall(x, y, nx, ny, cw, nw, walls)
+                walls[ny, nx] |= VISITED_BIT
                 stack.append((nx, ny))
             else:
                 stack.pop()
 
-    def _find_start_cell(self, maze: List[List[Cell]],
+    def _find_start_cell(self, walls: np.ndarray,
                          entry: Tuple[int, int]) -> Tuple[int, int]:
-        """Finds a valid starting cell."""
+        """
+        Finds a valid starting cell.
+
+        BFS from the entry, returning the first cell outside the '42'
+        pattern. Each cell is examined at most once, unlike the old
+        concentric-ring scan that revisited cells on every radius.
+        """
         ex, ey = entry
-        if not maze[ey][ex].is_42:
-            return ex, ey
+        queue: Deque[Tuple[int, int]] = deque([(ex, ey)])
+        seen = {(ex, ey)}
 
-        for radius in range(1, max(self.width, self.height)):
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    nx, ny = ex + dx, ey + dy
-                    if (self._is_valid_neighbor(nx, ny, maze) and
-                            not maze[ny][nx].is_42):
-                        return nx, ny
+        while queue:
+            x, y = queue.popleft()
+            if not walls[y, x] & IS42_BIT:
+                return x, y
+            for nx, ny in ((x, y - 1), (x, y + 1),
+                           (x - 1, y), (x + 1, y)):
+                if (0 <= nx < self.width and 0 <= ny < self.height and
+                        (nx, ny) not in seen):
+                    seen.add((nx, ny))
+                    queue.append((nx, ny))
 
         raise ValueError("No se encontró celda de inicio válida")
 
-    def _process_neighbor(self, y: int, x: int, ny: int, nx: int,
-                          cw: str, nw: str, direction: str,
-                          visited: List[List[bool]],
-                          prev: Dict[Tuple[int, int],
-                                     Tuple[Tuple[int, int], str]],
-                          queue: Deque[Tuple[int, int]]) -> None:
-        """Processes a neighbor during BFS."""
-        if self.maze is None:
-            return
-
-        current_cell = self.maze[y][x]
-        neighbor = self.maze[ny][nx]
-
-        if (getattr(current_cell, cw) and getattr(neighbor, nw) and
-                not neighbor.is_42 and not visited[ny][nx]):
-            visited[ny][nx] = True
-            prev[(ny, nx)] = ((y, x), direction)
-            queue.append((ny, nx))
-
-    def _cell_to_hex(self, cell: Cell) -> str:
-        """
-        Converts a cell to its hexadecimal representation.
-
-        Bits: active bit = CLOSED wall (no passage).
-        N=0x1, E=0x2, S=0x4, W=0x8
-        A cell with all walls closed equals 0xF.
-        """
-        value = 0
-        if not cell.n:
-            value |= 0x1
-        if not cell.e:
-            value |= 0x2
-        if not cell.s:
-            value |= 0x4
-        if not cell.w:
-            value |= 0x8
-        return format(value, "X")
+    def _build_cell_matrix(self, walls: np.ndarray) -> List[List[Cell]]:
+        """Builds the Cell proxy matrix from the packed grid."""
+        matrix = []
+        for y in range(self.height):
+            row = []
+            for x in range(self.width):
+                flags = int(walls[y, x])
+                cell = Cell(x, y)
+                cell.n = bool(flags & N_BIT)
+                cell.s = bool(flags & S_BIT)
+                cell.e = bool(flags & E_BIT)
+                cell.w = bool(flags & W_BIT)
+                cell.visited = bool(flags & VISITED_BIT)
+                cell.is_42 = bool(flags & IS42_BIT)
+                row.append(cell)
+            matrix.append(row)
+        return matrix